@@ -0,0 +1,126 @@
+"""
+Offline replay benchmark for the ETA estimator.
+
+Generates synthetic GPS traces (agents driving an L-shaped "city block" route
+with traffic stops and GPS noise), then replays them through:
+
+  * naive:     haversine + fixed-speed ETA for every update and every watching
+               client, emitting every time
+  * estimator: EtaEstimator, one computation per update, emitting only when
+               the ETA moves by more than the threshold
+
+Usage: python benchmarks/eta_replay.py [--agents 500] [--watchers 3] [--seed 1]
+"""
+import argparse
+import heapq
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import EtaEstimator, haversine
+
+KM_PER_DEG_LAT = 111.32
+
+
+def generate_trace(rng, order_id, start_time, interval_seconds):
+    """Returns (points, dest_lat, dest_lng) where points are (timestamp, order_id, lat, lng, seconds_left)."""
+    origin_lat = 12.9 + rng.uniform(-0.1, 0.1)
+    origin_lng = 77.6 + rng.uniform(-0.1, 0.1)
+    km_per_deg_lng = KM_PER_DEG_LAT * math.cos(math.radians(origin_lat))
+
+    # Drive north/south first, then east/west, like following city blocks
+    north_km, east_km = rng.uniform(-5, 5), rng.uniform(-5, 5)
+    corner = (origin_lat + north_km / KM_PER_DEG_LAT, origin_lng)
+    dest = (corner[0], origin_lng + east_km / km_per_deg_lng)
+    legs = [((origin_lat, origin_lng), corner, abs(north_km)), (corner, dest, abs(east_km))]
+
+    cruise_kmh = rng.uniform(15, 35)
+    samples = [] # (elapsed_seconds, lat, lng)
+    elapsed = 0.0
+    for (start, end, length_km) in legs:
+        travelled = 0.0
+        while travelled < length_km:
+            stopped = rng.random() < 0.08 # Traffic light / congestion
+            speed = 0.0 if stopped else max(3.0, rng.gauss(cruise_kmh, 5))
+            travelled = min(length_km, travelled + speed * interval_seconds / 3600)
+            fraction = travelled / length_km if length_km else 1.0
+            lat = start[0] + (end[0] - start[0]) * fraction
+            lng = start[1] + (end[1] - start[1]) * fraction
+            elapsed += interval_seconds
+            samples.append((elapsed, lat, lng))
+
+    arrival = elapsed
+    noise_deg = 0.01 / KM_PER_DEG_LAT # ~10 m of GPS noise
+    points = [
+        (start_time + t, order_id, lat + rng.gauss(0, noise_deg), lng + rng.gauss(0, noise_deg), arrival - t)
+        for t, lat, lng in samples
+    ]
+    return points, dest[0], dest[1]
+
+
+def run_naive(traces, destinations, watchers, default_speed_kmh, route_factor):
+    emits = 0
+    abs_error = 0.0
+    started = time.perf_counter()
+    for _, order_id, lat, lng, seconds_left in heapq.merge(*traces):
+        dest_lat, dest_lng = destinations[order_id]
+        for _ in range(watchers):
+            distance = haversine(lat, lng, dest_lat, dest_lng)
+            eta = distance * route_factor / default_speed_kmh * 3600
+            emits += 1
+        abs_error += abs(eta - seconds_left)
+    return time.perf_counter() - started, emits, abs_error
+
+
+def run_estimator(traces, destinations, watchers, estimator):
+    for order_id, (dest_lat, dest_lng) in destinations.items():
+        estimator.start(order_id, order_id, dest_lat, dest_lng) # One agent per order
+    emits = 0
+    abs_error = 0.0
+    shown = {} # order_id -> last ETA the customer saw
+    started = time.perf_counter()
+    for timestamp, order_id, lat, lng, seconds_left in heapq.merge(*traces):
+        result = estimator.update(order_id, lat, lng, timestamp)
+        if result:
+            emits += watchers # One room emit fans out to every watcher
+            shown[order_id] = (timestamp, result[0])
+        # The client counts down locally between updates
+        shown_at, shown_eta = shown.get(order_id, (timestamp, 0.0))
+        abs_error += abs(shown_eta - (timestamp - shown_at) - seconds_left)
+    return time.perf_counter() - started, emits, abs_error
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--agents', type=int, default=500)
+    parser.add_argument('--watchers', type=int, default=3, help='Clients watching each order')
+    parser.add_argument('--interval', type=float, default=3.0, help='Seconds between GPS updates')
+    parser.add_argument('--threshold', type=float, default=60.0, help='ETA change (seconds) worth emitting')
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    traces, destinations = [], {}
+    for order_id in range(args.agents):
+        points, dest_lat, dest_lng = generate_trace(rng, order_id, rng.uniform(0, 600), args.interval)
+        traces.append(points)
+        destinations[order_id] = (dest_lat, dest_lng)
+    updates = sum(len(points) for points in traces)
+
+    estimator = EtaEstimator(threshold_seconds=args.threshold)
+    naive_time, naive_emits, naive_error = run_naive(
+        traces, destinations, args.watchers, estimator.default_speed_kmh, estimator.route_factor)
+    est_time, est_emits, est_error = run_estimator(traces, destinations, args.watchers, estimator)
+
+    print(f'{args.agents} agents, {updates} GPS updates, {args.watchers} watchers per order')
+    print(f'{"":10} {"time (ms)":>10} {"emits":>10} {"mean abs error (s)":>20}')
+    print(f'{"naive":10} {naive_time * 1000:>10.1f} {naive_emits:>10} {naive_error / updates:>20.1f}')
+    print(f'{"estimator":10} {est_time * 1000:>10.1f} {est_emits:>10} {est_error / updates:>20.1f}')
+
+
+if __name__ == '__main__':
+    main()
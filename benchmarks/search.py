@@ -0,0 +1,143 @@
+"""
+Benchmark for the menu search index.
+
+Builds a synthetic catalogue (100k menu items by default), then compares
+SearchIndex against a naive scan that applies the same matching rules to every
+row (as a per-request query over the menu tables would), with and without the
+nearby-distance filter.
+Also times incremental updates, as done by manage_menu / edit_menu_item /
+delete_menu_item.
+
+Usage: python benchmarks/search.py [--items 100000] [--restaurants 2000] [--seed 1]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import SearchIndex, haversine, tokenize
+
+CUISINES = ['Indian', 'Chinese', 'Italian', 'Mexican', 'Thai', 'Japanese', 'American', 'Mughlai', 'Kerala', 'Cafe']
+DISHES = ['biryani', 'pizza', 'noodles', 'burger', 'tacos', 'curry', 'sushi', 'dosa', 'paneer', 'ramen',
+          'pasta', 'salad', 'sandwich', 'momos', 'kebab', 'soup', 'fries', 'idli', 'lasagna', 'burrito']
+WORDS = ['spicy', 'chicken', 'mutton', 'veg', 'cheese', 'butter', 'garlic', 'crispy', 'grilled', 'special',
+         'masala', 'classic', 'smoky', 'tangy', 'family', 'mini', 'double', 'house', 'fresh', 'hot']
+QUERIES = ['biryani', 'spicy chicken', 'paneer butter masala', 'indian biryani', 'chees', 'garlic noodles',
+           'thai curry', 'family pizza', 'smoky kebab', 'special dosa']
+
+
+def make_catalogue(rng, restaurant_count, item_count):
+    restaurants = [
+        {'id': n, 'name': f'{rng.choice(WORDS).title()} {rng.choice(DISHES).title()} House {n}',
+         'address': f'{n} Main St', 'cuisine_type': rng.choice(CUISINES),
+         'latitude': 12.9 + rng.uniform(-0.3, 0.3), 'longitude': 77.6 + rng.uniform(-0.3, 0.3)}
+        for n in range(restaurant_count)
+    ]
+    items = [
+        {'id': n, 'restaurant_id': rng.randrange(restaurant_count),
+         'name': f'{rng.choice(WORDS).title()} {rng.choice(DISHES).title()}',
+         'description': ' '.join(rng.sample(WORDS, 4)), 'price': round(rng.uniform(2, 30), 2)}
+        for n in range(item_count)
+    ]
+    return restaurants, items
+
+
+def naive_search(query, restaurants, items):
+    """
+    Same matching rules as SearchIndex, done by scanning every row: whole tokens,
+    except the last query word, which also matches as a prefix (2+ characters).
+    """
+    words = tokenize(query)
+    if not words:
+        return {}
+    *whole, last = words
+
+    def matches(tokens):
+        if not all(word in tokens for word in whole):
+            return False
+        if len(last) < 2:
+            return last in tokens
+        return any(token.startswith(last) for token in tokens)
+
+    results = {}
+    for restaurant in restaurants.values():
+        if matches(set(tokenize(restaurant['name']) + tokenize(restaurant['cuisine_type']))):
+            results.setdefault(restaurant['id'], [])
+    for item in items:
+        restaurant = restaurants[item['restaurant_id']]
+        tokens = set(tokenize(item['name']) + tokenize(item['description'])
+                     + tokenize(restaurant['name']) + tokenize(restaurant['cuisine_type']))
+        if matches(tokens):
+            results.setdefault(item['restaurant_id'], []).append(item)
+    return results
+
+
+def nearby(results, restaurants, lat, lon):
+    return [rid for rid in results if haversine(lat, lon, restaurants[rid]['latitude'], restaurants[rid]['longitude']) < 10]
+
+
+def time_queries(search, repeat):
+    samples = []
+    for _ in range(repeat):
+        for query in QUERIES:
+            started = time.perf_counter()
+            search(query)
+            samples.append(time.perf_counter() - started)
+    samples.sort()
+    return statistics.median(samples) * 1000, samples[int(len(samples) * 0.95)] * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--items', type=int, default=100000)
+    parser.add_argument('--restaurants', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    restaurant_list, items = make_catalogue(rng, args.restaurants, args.items)
+    restaurants = {restaurant['id']: restaurant for restaurant in restaurant_list}
+    lat, lon = 12.9, 77.6
+
+    index = SearchIndex()
+    started = time.perf_counter()
+    index.rebuild(lambda: (restaurant_list, items))
+    build_ms = (time.perf_counter() - started) * 1000
+
+    print(f'{args.items} menu items, {args.restaurants} restaurants; index built in {build_ms:.0f} ms')
+    print(f'{"":24} {"p50 (ms)":>10} {"p95 (ms)":>10}')
+    rows = [
+        ('naive scan', lambda q: naive_search(q, restaurants, items)),
+        ('index', index.search),
+        ('naive scan + nearby', lambda q: nearby(naive_search(q, restaurants, items), restaurants, lat, lon)),
+        ('index + nearby', lambda q: nearby(index.search(q), restaurants, lat, lon)),
+    ]
+    for label, search in rows:
+        repeat = 1 if label.startswith('naive') else args.repeat
+        p50, p95 = time_queries(search, repeat)
+        print(f'{label:24} {p50:>10.3f} {p95:>10.3f}')
+
+    # Incremental updates, as done by the menu routes
+    update_samples = []
+    for n in range(1000):
+        item = dict(rng.choice(items), name=f'{rng.choice(WORDS).title()} {rng.choice(DISHES).title()}')
+        started = time.perf_counter()
+        if n % 10 == 0:
+            index.remove_item(item['id'])
+        else:
+            index.upsert_item(item)
+        update_samples.append(time.perf_counter() - started)
+    started = time.perf_counter()
+    index.search('chees') # First prefix search after updates re-sorts the vocabulary
+    resort_ms = (time.perf_counter() - started) * 1000
+    print(f'incremental update: median {statistics.median(update_samples) * 1e6:.1f} us; '
+          f'first prefix search afterwards {resort_ms:.3f} ms')
+
+
+if __name__ == '__main__':
+    main()
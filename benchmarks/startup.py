@@ -0,0 +1,96 @@
+"""
+Time-to-first-response benchmark for worker boot.
+
+Starts fresh Python processes (so imports, DB connections and Jinja are all
+cold), boots the app with and without the warm-up phase, and times the first
+request to a few browsing pages.
+
+By default it seeds a temporary SQLite database. Pass --database-uri to run
+against a real (already populated) PostgreSQL database instead.
+
+Usage: python benchmarks/startup.py [--runs 5] [--restaurants 200] [--database-uri URI]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SEED = """
+import sys
+sys.path.insert(0, {root!r})
+import app as swiftserve
+with swiftserve.app.app_context():
+    db = swiftserve.db
+    db.create_all()
+    for n in range({restaurants}):
+        user = swiftserve.User(email=f'owner{{n}}@example.com', role='restaurant', password_hash='x')
+        db.session.add(user)
+        db.session.flush()
+        restaurant = swiftserve.Restaurant(user_id=user.id, name=f'Restaurant {{n}}', address=f'{{n}} Main St',
+                                           cuisine_type='Indian', latitude=12.9 + n * 1e-4, longitude=77.6)
+        db.session.add(restaurant)
+        db.session.flush()
+        for i in range(20):
+            db.session.add(swiftserve.MenuItem(restaurant_id=restaurant.id, name=f'Dish {{i}}',
+                                               description='Tasty', price=5 + i))
+    db.session.commit()
+"""
+
+CHILD = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+import app as swiftserve
+application = swiftserve.create_app(warm={warm})
+ready = time.perf_counter()
+client = application.test_client()
+timings = {{'boot': ready - swiftserve.BOOT_STARTED_AT}}
+for path in {paths!r}:
+    started = time.perf_counter()
+    response = client.get(path)
+    assert response.status_code == 200, (path, response.status_code)
+    timings[path] = time.perf_counter() - started
+timings['time_to_first_response'] = swiftserve.startup_timings['time_to_first_response_seconds']
+print(json.dumps(timings))
+"""
+
+PATHS = ['/', '/restaurant/1', '/api/nearby-restaurants?lat=12.9&lon=77.6']
+
+
+def run(code, env):
+    result = subprocess.run([sys.executable, '-c', code], env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        sys.exit(result.stderr)
+    return result.stdout.strip().splitlines()[-1] if result.stdout.strip() else ''
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--restaurants', type=int, default=200, help='Restaurants to seed (SQLite only)')
+    parser.add_argument('--database-uri', help='Use an existing database instead of seeding SQLite')
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    if args.database_uri:
+        env['SQLALCHEMY_DATABASE_URI'] = args.database_uri
+    else:
+        db_path = os.path.join(tempfile.mkdtemp(), 'startup_bench.db')
+        env['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{db_path}'
+        run(SEED.format(root=ROOT, restaurants=args.restaurants), env)
+
+    columns = ['boot'] + PATHS + ['time_to_first_response']
+    print(f'{"":8}' + ''.join(f'{column[:24]:>26}' for column in columns))
+    for warm in (False, True):
+        samples = [json.loads(run(CHILD.format(root=ROOT, warm=warm, paths=PATHS), env)) for _ in range(args.runs)]
+        medians = [statistics.median(sample[column] for sample in samples) * 1000 for column in columns]
+        label = 'warm' if warm else 'cold'
+        print(f'{label:8}' + ''.join(f'{median:>23.1f} ms' for median in medians))
+
+
+if __name__ == '__main__':
+    main()